@@ -11,11 +11,12 @@ def main():
     trades_df = load_or_create_csv(TRADES_FILE, ["Date", "Symbol", "Action", "Price", "Shares", "Cost"])
 
     today = datetime.now(pytz.timezone(TIMEZONE)).strftime("%Y-%m-%d")
+    new_trades = []
 
     universe = get_universe()
     close_data = download_data(universe)
 
-    latest_prices = close_data.iloc[-1].to_dict()
+    latest_prices = dict(zip(close_data.columns, close_data.to_numpy()[-1]))
 
     # =========================
     # DATA VALIDATION GUARD
@@ -38,14 +39,16 @@ Rebalance aborted for safety.
     # Load portfolio
     portfolio = {}
     if not portfolio_df.empty:
-        for _, row in portfolio_df.iterrows():
-            portfolio[row["Symbol"]] = row["Shares"]
+        portfolio = dict(zip(
+            portfolio_df["Symbol"].to_numpy(),
+            portfolio_df["Shares"].to_numpy()
+        ))
 
     # If first run
     if nav_df.empty:
         capital = INITIAL_CAPITAL
     else:
-        capital = nav_df.iloc[-1]["NAV"]
+        capital = nav_df["NAV"].to_numpy()[-1]
 
     # Calculate current value
     invested_value = calculate_portfolio_value(portfolio, latest_prices)
@@ -59,19 +62,21 @@ Rebalance aborted for safety.
         message_lines.append("🔁 Rebalance executed.")
 
         selected = select_stocks(universe)
+        selected_set = frozenset(selected)
 
         # SELL stocks not in selected
         for symbol in list(portfolio.keys()):
-            if symbol not in selected:
+            if symbol not in selected_set:
                 price = latest_prices.get(symbol, 0)
                 shares = portfolio[symbol]
                 proceeds = shares * price
                 cost = proceeds * BROKERAGE_RATE
                 cash += proceeds - cost
 
-                trades_df.loc[len(trades_df)] = [
-                    today, symbol, "SELL", price, shares, cost
-                ]
+                new_trades.append({
+                    "Date": today, "Symbol": symbol, "Action": "SELL",
+                    "Price": price, "Shares": shares, "Cost": cost
+                })
 
                 del portfolio[symbol]
 
@@ -92,9 +97,10 @@ Rebalance aborted for safety.
                     cash -= total_cost
                     portfolio[symbol] = shares
 
-                    trades_df.loc[len(trades_df)] = [
-                        today, symbol, "BUY", price, shares, cost
-                    ]
+                    new_trades.append({
+                        "Date": today, "Symbol": symbol, "Action": "BUY",
+                        "Price": price, "Shares": shares, "Cost": cost
+                    })
 
     else:
         message_lines.append("ℹ️ Not Friday. No rebalance.")
@@ -125,9 +131,12 @@ Drawdown: {drawdown:.2%}
 """
         send_telegram_message(dd_message)
 
-    # Save NAV
-    nav_df.loc[len(nav_df)] = [today, nav]
-    nav_df.to_csv(NAV_FILE, index=False)
+    # Save NAV (append only today's row once history exists)
+    nav_row = pd.DataFrame([{"Date": today, "NAV": nav}], columns=nav_df.columns)
+    if nav_df.empty:
+        nav_row.to_csv(NAV_FILE, index=False)
+    else:
+        nav_row.to_csv(NAV_FILE, mode="a", header=False, index=False)
 
     # Save portfolio
     portfolio_df = pd.DataFrame([
@@ -135,8 +144,12 @@ Drawdown: {drawdown:.2%}
     ])
     portfolio_df.to_csv(PORTFOLIO_FILE, index=False)
 
-    # Save trades
-    trades_df.to_csv(TRADES_FILE, index=False)
+    # Save trades (append only this run's trades once history exists)
+    new_trades_df = pd.DataFrame(new_trades, columns=trades_df.columns)
+    if trades_df.empty:
+        new_trades_df.to_csv(TRADES_FILE, index=False)
+    elif new_trades:
+        new_trades_df.to_csv(TRADES_FILE, mode="a", header=False, index=False)
 
     # Reporting
     total_return = ((nav - INITIAL_CAPITAL) / INITIAL_CAPITAL) * 100